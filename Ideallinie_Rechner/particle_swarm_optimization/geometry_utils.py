@@ -6,7 +6,7 @@ import numpy as np
 import math
 
 
-def parametric_spline_fit(x, y, num_points=1000):
+def parametric_spline_fit(x, y, num_points=1000, dtype=np.float64):
     """
     Interpoliert eine parametrisierte Kurve (ähnlich scipy's splprep + splev).
 
@@ -20,6 +20,8 @@ def parametric_spline_fit(x, y, num_points=1000):
         y-Koordinaten der Stützpunkte
     num_points : int, optional
         Anzahl der interpolierten Punkte (Standard: 1000)
+    dtype : np.dtype, optional
+        Gleitkommatyp der Berechnung, z. B. np.float32 (Standard: np.float64)
 
     Returns
     -------
@@ -28,6 +30,8 @@ def parametric_spline_fit(x, y, num_points=1000):
     y_interp : np.ndarray
         Interpolierte y-Koordinaten
     """
+    x = np.asarray(x, dtype=dtype)
+    y = np.asarray(y, dtype=dtype)
     dx = np.diff(x)
     dy = np.diff(y)
     dist = np.sqrt(dx**2 + dy**2)
@@ -45,13 +49,13 @@ def parametric_spline_fit(x, y, num_points=1000):
             y0, y1 = values_known[i], values_known[i + 1]
             t = (uq - u0) / (u1 - u0)
             result.append((1 - t) * y0 + t * y1)
-        return np.array(result)
+        return np.array(result, dtype=dtype)
 
-    u_query = np.linspace(0, 1, num_points)
+    u_query = np.linspace(0, 1, num_points, dtype=dtype)
     return interp(u, x, u_query), interp(u, y, u_query)
 
 
-def interpolate_along_line(points, distance):
+def interpolate_along_line(points, distance, dtype=np.float64):
     """
     Gibt einen Punkt zurück, der in einer bestimmten Distanz entlang einer polyline liegt.
 
@@ -61,6 +65,8 @@ def interpolate_along_line(points, distance):
         Liste von Punkten (2D-Vektoren), die eine Linie definieren
     distance : float
         Abstand vom Startpunkt der Linie
+    dtype : np.dtype, optional
+        Gleitkommatyp der Berechnung (Standard: np.float64)
 
     Returns
     -------
@@ -69,16 +75,17 @@ def interpolate_along_line(points, distance):
     """
     d_total = 0
     for i in range(len(points) - 1):
-        p0, p1 = np.array(points[i]), np.array(points[i + 1])
+        p0 = np.array(points[i], dtype=dtype)
+        p1 = np.array(points[i + 1], dtype=dtype)
         d_segment = np.linalg.norm(p1 - p0)
         if d_total + d_segment >= distance:
             t = (distance - d_total) / d_segment
-            return (1 - t) * p0 + t * p1
+            return ((1 - t) * p0 + t * p1).astype(dtype)
         d_total += d_segment
-    return points[-1]
+    return np.array(points[-1], dtype=dtype)
 
 
-def parallel_offset_polyline(points, offset):
+def parallel_offset_polyline(points, offset, dtype=np.float64):
     """
     Erzeugt eine parallele Linie mit konstantem seitlichen Offset.
 
@@ -90,6 +97,8 @@ def parallel_offset_polyline(points, offset):
         Ursprungslinie (Liste von Punkten)
     offset : float
         Seitlicher Abstand (positiv = links, negativ = rechts)
+    dtype : np.dtype, optional
+        Gleitkommatyp der Berechnung (Standard: np.float64)
 
     Returns
     -------
@@ -98,8 +107,8 @@ def parallel_offset_polyline(points, offset):
     """
     offset_line = []
     for i in range(len(points) - 1):
-        p1 = np.array(points[i])
-        p2 = np.array(points[i + 1])
+        p1 = np.array(points[i], dtype=dtype)
+        p2 = np.array(points[i + 1], dtype=dtype)
         dir_vec = p2 - p1
         dir_vec /= np.linalg.norm(dir_vec)
         normal = np.array([-dir_vec[1], dir_vec[0]])  # 90°-Drehung für normalen Vektor
@@ -109,4 +118,4 @@ def parallel_offset_polyline(points, offset):
         if i == 0:
             offset_line.append(offset_p1)
         offset_line.append(offset_p2)
-    return np.array(offset_line)
+    return np.array(offset_line, dtype=dtype)
@@ -34,6 +34,7 @@ def main():
     cg = 3.8876
 
     plot = True  # Steuerung der grafischen Ausgabe
+    dtype = np.float64  # Gleitkommatyp der Rundenzeitberechnung (np.float32 möglich)
 
     # Einlesen der Streckendaten
     with open("race_tracks/drawn_race_track.json") as file:
@@ -82,7 +83,8 @@ def main():
     # Kostenfunktion: basiert auf der berechneten Rundenzeit
     def myCostFunc(sectors):
         return get_lap_time(
-            sectors_to_racing_line(sectors, inside_points, outside_points)
+            sectors_to_racing_line(sectors, inside_points, outside_points),
+            dtype=dtype,
         )
 
     # PSO-Optimierung ausführen
@@ -98,6 +100,12 @@ def main():
         verbose=True,
     )
 
+    # Abweichung des float32-Modus gegenüber float64 prüfen
+    if dtype != np.float64:
+        validate_precision(
+            gs_history, inside_points, outside_points, dtype=dtype, verbose=True
+        )
+
     # Beste Lösung analysieren
     _, v, x, y = get_lap_time(
         sectors_to_racing_line(global_solution, inside_points, outside_points),
@@ -173,9 +181,10 @@ def sectors_to_racing_line(sectors, inside_points, outside_points):
 
 
 # Berechnet die Rundenzeit (und optional Kurvenradien & Positionen)
-def get_lap_time(racing_line, return_all=False):
-    rl = np.array(racing_line)
-    x, y = parametric_spline_fit(rl[:, 0], rl[:, 1], num_points=1000)
+# dtype=np.float32 halbiert den Speicherbedarf der 1000-Punkte-Arrays
+def get_lap_time(racing_line, return_all=False, dtype=np.float64):
+    rl = np.array(racing_line, dtype=dtype)
+    x, y = parametric_spline_fit(rl[:, 0], rl[:, 1], num_points=1000, dtype=dtype)
 
     # Erste und zweite Ableitungen der Position
     dx, dy = np.gradient(x), np.gradient(y)
@@ -183,22 +192,49 @@ def get_lap_time(racing_line, return_all=False):
 
     # Krümmung berechnen
     curvature = np.abs(dx * d2y - d2x * dy) / (dx * dx + dy * dy) ** 1.5
-    radius = [1 / c if c != 0 else 1e6 for c in curvature]
+    radius = np.full_like(curvature, 1e6)
+    np.divide(1, curvature, out=radius, where=curvature != 0)
 
     us = 0.13  # Seitenhaftbeiwert
-    v = [min(40, math.sqrt(us * r * 9.81)) for r in radius]  # Geschwindigkeitsprofil
-    lap_time = sum(
-        [
-            math.sqrt((x[i] - x[i + 1]) ** 2 + (y[i] - y[i + 1]) ** 2) / v[i]
-            for i in range(len(x) - 1)
-        ]
-    )
+    v = np.minimum(40, np.sqrt(us * radius * 9.81))  # Geschwindigkeitsprofil
+    lap_time = float(np.sum(np.hypot(np.diff(x), np.diff(y)) / v[:-1]))
 
     if return_all:
         return lap_time, v, x, y
     return lap_time
 
 
+# Vergleicht die Rundenzeiten in float32 mit float64 für gegebene Lösungen,
+# um vor Nutzung des float32-Modus zu prüfen, dass die beste Linie gleich bleibt
+def validate_precision(
+    solutions, inside_points, outside_points, dtype=np.float32, verbose=False
+):
+    racing_lines = [
+        sectors_to_racing_line(s, inside_points, outside_points) for s in solutions
+    ]
+    reference = np.array([get_lap_time(rl, dtype=np.float64) for rl in racing_lines])
+    reduced = np.array([get_lap_time(rl, dtype=dtype) for rl in racing_lines])
+
+    deviation = np.abs(reduced - reference)
+    result = {
+        "max_abs_deviation": float(np.max(deviation)),
+        "max_rel_deviation": float(np.max(deviation / reference)),
+        "best_index_reference": int(np.argmin(reference)),
+        "best_index_reduced": int(np.argmin(reduced)),
+    }
+    result["same_best_line"] = (
+        result["best_index_reference"] == result["best_index_reduced"]
+    )
+
+    if verbose:
+        print(f"\nGENAUIGKEIT ({np.dtype(dtype).name} vs. float64)")
+        print(f"Max. abs. Abweichung: {result['max_abs_deviation']:.6f} s")
+        print(f"Max. rel. Abweichung: {result['max_rel_deviation']:.2e}")
+        print(f"Gleiche beste Linie:  {result['same_best_line']}")
+
+    return result
+
+
 # Erzeugt Punkte entlang der Strecke zur Definition der Sektoren
 def define_sectors(center_line, inside_line, outside_line, n_sectors):
     center_length = sum(